@@ -19,15 +19,30 @@ iFlow Runner - 自动化运行 iFlow CLI 的调度脚本
 """
 
 import argparse
+import asyncio
+import hashlib
+import itertools
 import json
-import subprocess
 import sys
 import time
 import os
 import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Union, Deque, FrozenSet
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，未安装时回退到标准库
+    orjson = None
+
+# orjson.loads 与 json.loads 都直接接受 UTF-8 bytes，读取文件时无需先解码为文本；
+# orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，异常处理不受影响
+_json_loads = orjson.loads if orjson else json.loads
 
 
 def load_config(project_root: str) -> Dict[str, Any]:
@@ -54,8 +69,7 @@ def load_config(project_root: str) -> Dict[str, Any]:
     for config_path in config_paths:
         if config_path.exists():
             try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                config = _json_loads(config_path.read_bytes())
                 print(f"📋 已加载配置: {config_path}")
                 return config
             except json.JSONDecodeError as e:
@@ -66,36 +80,88 @@ def load_config(project_root: str) -> Dict[str, Any]:
     return {}
 
 
+@lru_cache(maxsize=1)
 def find_iflow_path() -> Optional[str]:
     """
     查找 iflow 命令的完整路径
     
+    结果在进程内缓存，进程运行期间安装位置不会变化；同时持久化到
+    ~/.cache/ai-harness/iflow_path.json，PATH 与平台不变且文件仍存在时跨进程复用。
+    
     Returns:
         iflow 命令的完整路径，如果找不到返回 None
     """
+    cache_file = Path.home() / ".cache" / "ai-harness" / "iflow_path.json"
+    key = hashlib.blake2b((os.environ.get('PATH', '') + sys.platform).encode('utf-8'),
+                          digest_size=8).hexdigest()
+    
+    try:
+        cached = _json_loads(cache_file.read_bytes())
+        if cached.get("key") == key and os.path.isfile(cached.get("path", "")):
+            return cached["path"]
+    except (OSError, ValueError, AttributeError, TypeError):
+        # 缓存不存在或已损坏，重新查找
+        pass
+    
+    iflow_path = _discover_iflow_path()
+    if iflow_path:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            tmp_file.write_text(json.dumps({"key": key, "path": iflow_path}), encoding='utf-8')
+            # 先写临时文件再替换，避免并发进程读到写了一半的缓存
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+    return iflow_path
+
+
+@lru_cache(maxsize=1)
+def _node_paths() -> Tuple[str, ...]:
+    """需要加入 PATH 的 Node.js/npm 目录（只保留存在的目录，进程内只检查一次）"""
+    node_paths = (
+        r'C:\nvm4w\nodejs',
+        os.path.expandvars(r'%APPDATA%\npm'),
+    )
+    return tuple(path for path in node_paths if os.path.isdir(path))
+
+
+def _discover_iflow_path() -> Optional[str]:
+    """在 PATH 和常见安装位置中查找 iflow 命令"""
     # 1. 尝试直接查找
     iflow_path = shutil.which('iflow')
     if iflow_path:
         return iflow_path
     
-    # 2. 尝试常见路径
-    common_paths = [
-        r'C:\nvm4w\nodejs\iflow.cmd',
-        r'C:\nvm4w\nodejs\iflow',
-        os.path.expandvars(r'%APPDATA%\npm\iflow.cmd'),
-        os.path.expandvars(r'%APPDATA%\npm\iflow'),
-        '/usr/local/bin/iflow',
-        '/usr/bin/iflow',
-    ]
+    # 2. 尝试常见路径（只检查当前平台的路径）
+    if sys.platform == 'win32':
+        common_paths = [
+            r'C:\nvm4w\nodejs\iflow.cmd',
+            r'C:\nvm4w\nodejs\iflow',
+            os.path.expandvars(r'%APPDATA%\npm\iflow.cmd'),
+            os.path.expandvars(r'%APPDATA%\npm\iflow'),
+        ]
+    else:
+        common_paths = [
+            '/usr/local/bin/iflow',
+            '/usr/bin/iflow',
+        ]
     
+    # 同一目录下有多个候选文件，先确认目录存在，目录不存在时跳过其下所有候选
+    dir_exists: Dict[str, bool] = {}
     for path in common_paths:
-        if os.path.isfile(path):
+        parent = os.path.dirname(path)
+        if parent not in dir_exists:
+            dir_exists[parent] = os.path.isdir(parent)
+        if dir_exists[parent] and os.path.isfile(path):
             return path
     
-    # 3. 尝试从环境变量 PATH 中查找
+    # 3. 尝试从环境变量 PATH 中查找（去掉空项和重复目录，每个目录只探测一次）
     path_env = os.environ.get('PATH', '')
-    for path_dir in path_env.split(os.pathsep):
-        for name in ['iflow.cmd', 'iflow']:
+    for path_dir in dict.fromkeys(path_env.split(os.pathsep)):
+        if not path_dir:
+            continue
+        for name in ('iflow.cmd', 'iflow'):
             candidate = os.path.join(path_dir, name)
             if os.path.isfile(candidate):
                 return candidate
@@ -103,6 +169,117 @@ def find_iflow_path() -> Optional[str]:
     return None
 
 
+def _file_signature(path: str) -> Tuple[int, int]:
+    """
+    文件版本标识 (st_mtime_ns, st_size)
+    
+    iflow 子进程会改写 feature_list.json；同时比较大小，
+    可以识别 mtime 精度较粗的文件系统上同一时刻内发生的改写。
+    """
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _now_str(fmt: str = '%Y-%m-%d %H:%M:%S') -> str:
+    """格式化当前本地时间，直接调用 time.strftime 而不创建 datetime 对象"""
+    return time.strftime(fmt)
+
+
+def _is_completed(feature: Dict) -> bool:
+    """判断任务是否已完成（兼容 status 和 passes 两种状态字段）"""
+    return feature.get("status", "") in ("completed", "done") or feature.get("passes") is True
+
+
+# 超过此大小的 iflow 输出文件不再解析，只记录文件大小
+_MAX_OUTPUT_PARSE_BYTES = 8 * 1024 * 1024
+
+# iflow 单个输出流 (stdout/stderr) 的总量上限，超过后终止子进程
+_MAX_STREAM_BYTES = 50 * 1024 * 1024
+
+# 扫描项目时跳过的目录（隐藏目录另行按名称前缀跳过）
+_SKIP_DIRS = frozenset({'node_modules', '__pycache__', '.git'})
+
+# 任务优先级排序，未知优先级按 medium 处理
+_PRIORITY_ORDER = {"P0": 0, "P1": 1, "P2": 2, "high": 0, "medium": 1, "low": 2}
+
+
+def _priority_key(feature: Dict) -> int:
+    return _PRIORITY_ORDER.get(feature.get("priority", "medium"), 1)
+
+
+@dataclass(frozen=True)
+class FeatureSnapshot:
+    """feature_list.json 某一版本的汇总结果，由 iFlowRunner 按文件版本缓存，调用方不应修改"""
+    features: List[Dict]
+    total: int
+    completed: int
+    passing_ids: FrozenSet[Any]
+    pending: List[Dict]  # 未完成任务，保持文件中的顺序
+    pending_sorted: List[Dict]  # 未完成任务，按优先级稳定排序
+    
+    @property
+    def next_task(self) -> Optional[Dict]:
+        """优先级最高的未完成任务"""
+        return self.pending_sorted[0] if self.pending_sorted else None
+
+
+def _summarize(features: List[Dict]) -> FeatureSnapshot:
+    """单次遍历汇总任务列表"""
+    completed = 0
+    passing_ids = set()
+    pending = []
+    for feature in features:
+        if _is_completed(feature):
+            completed += 1
+            passing_ids.add(feature.get("id"))
+        else:
+            # status 为 pending/in_progress 或 passes 为 False/None 都算未完成
+            pending.append(feature)
+    return FeatureSnapshot(
+        features=features,
+        total=len(features),
+        completed=completed,
+        passing_ids=frozenset(passing_ids),
+        pending=pending,
+        # sorted 是稳定排序，同优先级保持文件中的顺序
+        pending_sorted=sorted(pending, key=_priority_key),
+    )
+
+
+class _OutputTail:
+    """只保留子进程输出末尾 keep_bytes 字节的环形缓冲，同时统计输出总量"""
+    
+    def __init__(self, keep_bytes: int):
+        self.keep_bytes = keep_bytes
+        self.chunks: Deque[bytes] = deque()
+        self.size = 0
+        self.total = 0
+    
+    def append(self, chunk: bytes) -> None:
+        self.chunks.append(chunk)
+        self.size += len(chunk)
+        self.total += len(chunk)
+        # 丢弃最旧的块，只要剩余部分仍不少于 keep_bytes
+        while self.size - len(self.chunks[0]) >= self.keep_bytes:
+            self.size -= len(self.chunks.popleft())
+    
+    def text(self, max_chars: int) -> str:
+        data = b''.join(self.chunks)[-self.keep_bytes:]
+        return data.decode('utf-8', errors='replace')[-max_chars:]
+
+
+async def _read_tail(stream: asyncio.StreamReader, tail: _OutputTail,
+                     proc: asyncio.subprocess.Process) -> None:
+    """按块读取子进程输出到 tail；输出总量超过上限时终止子进程"""
+    while True:
+        chunk = await stream.read(4096)
+        if not chunk:
+            break
+        tail.append(chunk)
+        if tail.total > _MAX_STREAM_BYTES and proc.returncode is None:
+            proc.kill()
+
+
 class iFlowRunner:
     """
     iFlow CLI 自动化运行器
@@ -115,97 +292,202 @@ class iFlowRunner:
     5. 循环执行
     """
     
-    def __init__(self, project_root: str):
+    # prompt 模板，由 generate_prompt 通过 format_map 填充
+    _PROMPT_TEMPLATE = """继续开发 **{project_name}** 项目的任务。
+
+⚠️ 重要：这是 {project_name} 项目，请只操作 {project_name}/ 目录下的文件！
+
+{task_section}
+
+## 执行要求
+1. 读取 {project_name}/.agent-harness/feature_list.json 确认任务状态
+2. 按照任务描述完成开发
+3. 完成后运行测试验证 (如适用)
+4. 更新 {project_name}/.agent-harness/feature_list.json 中的 passes 状态为 true
+5. 更新 {project_name}/.agent-harness/claude-progress.txt 记录进度
+
+## 重要提醒
+- {scope_hint}
+- 只操作 {project_name}/ 目录
+- {passes_hint}
+- 如果遇到阻塞问题，记录到 progress 文件中并停止
+"""
+    
+    _SINGLE_TASK_TEMPLATE = """## 当前任务
+- ID: {id}
+- 描述: {description}
+- 优先级: {priority}
+- 类型: {category}
+
+## 执行步骤
+{steps}"""
+    
+    _BATCH_TASK_TEMPLATE = """### 任务 {index}
+- ID: {id}
+- 描述: {description}
+- 优先级: {priority}
+- 类型: {category}
+
+执行步骤:
+{steps}"""
+    
+    def __init__(self, project_root: str, keep_outputs: int = 20):
         self.project_root = Path(project_root).resolve()
+        # 热路径上用字符串拼接路径，避免反复创建 Path 对象
+        self._project_root_str = str(self.project_root)
+        self._project_parent_str = str(self.project_root.parent)
         self.iflow_path = find_iflow_path()
+        # feature_list.json 汇总缓存: 文件路径 -> ((st_mtime_ns, st_size), FeatureSnapshot)
+        self._feature_cache: Dict[str, Tuple[Tuple[int, int], FeatureSnapshot]] = {}
+        # 项目状态缓存: 项目名 -> (feature_list.json 的 (st_mtime_ns, st_size), 状态字典)
+        self._status_cache: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+        # iflow 输出文件目录（首次执行时创建）
+        self._output_dir = self.project_root / ".agent-harness" / "iflow_runs"
+        # 输出文件序号：并行执行时同一进程内 time_ns 可能相同（Windows 时钟精度约 15.6ms）
+        self._run_seq = itertools.count()
+        # 最多保留的输出文件数，<= 0 表示不清理
+        self.keep_outputs = keep_outputs
+        # iflow 子进程使用的环境变量，只构建一次
+        self._env = self._build_env()
         
         if not self.iflow_path:
             print("⚠️ 警告: 未找到 iflow 命令，请确保已安装 iFlow CLI")
         else:
             print(f"✅ 找到 iflow: {self.iflow_path}")
         
-    def get_next_task(self, project_name: str = "ninesun-blog") -> Optional[Dict]:
-        """获取下一个待完成的任务"""
+    def _build_env(self) -> Dict[str, str]:
+        """构建 iflow 子进程的环境变量，确保能找到 node 和 npm"""
+        env = os.environ.copy()
+        extra_paths = list(_node_paths())
+        if extra_paths:
+            original_path = env.get('PATH', '')
+            # dict.fromkeys 保序去重，已在 PATH 中的目录不会重复添加
+            parts = dict.fromkeys(extra_paths + [p for p in original_path.split(os.pathsep) if p])
+            env['PATH'] = os.pathsep.join(parts)
+        # 每个任务都会启动新的 iflow (Node.js) 进程；开启 Node 的模块编译缓存
+        # (Node 22.1+ 支持，旧版本忽略)，后续启动复用已编译的代码，降低冷启动开销
+        env.setdefault('NODE_COMPILE_CACHE', str(Path.home() / ".cache" / "ai-harness" / "node-compile-cache"))
+        return env
+    
+    def _load_features(self, path: str) -> FeatureSnapshot:
+        """读取并汇总 feature_list.json，文件未修改时直接返回缓存结果"""
+        signature = _file_signature(path)
+        hit = self._feature_cache.get(path)
+        if hit and hit[0] == signature:
+            return hit[1]
+        with open(path, 'rb') as f:
+            data = _json_loads(f.read())
+        # 每个文件版本只汇总、排序一次
+        snapshot = _summarize(data.get("features", []))
+        self._feature_cache[path] = (signature, snapshot)
+        return snapshot
+    
+    def _feature_file(self, project_name: str) -> Optional[str]:
+        """定位项目的 feature_list.json，不存在时返回 None"""
         # 支持相对路径和绝对路径
-        if Path(project_name).is_absolute():
-            feature_file = Path(project_name) / ".agent-harness" / "feature_list.json"
+        if os.path.isabs(project_name):
+            candidates = (os.path.join(project_name, ".agent-harness", "feature_list.json"),)
         else:
-            feature_file = self.project_root / project_name / ".agent-harness" / "feature_list.json"
+            candidates = (
+                os.path.join(self._project_root_str, project_name, ".agent-harness", "feature_list.json"),
+                # 尝试父目录
+                os.path.join(self._project_parent_str, project_name, ".agent-harness", "feature_list.json"),
+            )
         
-        if not feature_file.exists():
-            # 尝试父目录
-            feature_file = self.project_root.parent / project_name / ".agent-harness" / "feature_list.json"
+        for feature_file in candidates:
+            if os.path.isfile(feature_file):
+                return feature_file
+        return None
+    
+    def get_next_task(self, project_name: str = "ninesun-blog") -> Optional[Dict]:
+        """获取下一个待完成的任务"""
+        feature_file = self._feature_file(project_name)
         
-        if not feature_file.exists():
-            print(f"feature_list.json 不存在: {feature_file}")
+        if not feature_file:
+            print(f"feature_list.json 不存在: {project_name}")
             return None
         
-        with open(feature_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        return self._load_features(feature_file).next_task
+    
+    def get_next_task_batch(self, project_name: str = "ninesun-blog", batch_size: int = 5) -> List[Dict]:
+        """
+        获取一批可以在同一次 iflow 调用中执行的任务
+        
+        第一个任务与 get_next_task 相同；其余任务按优先级挑选依赖已全部完成的任务，
+        因此批次内的任务互不依赖。第一个任务仍有未完成的依赖时只返回它一个，
+        避免其依赖的任务被排在它之后执行。
+        """
+        feature_file = self._feature_file(project_name)
         
-        features = data.get("features", [])
+        if not feature_file:
+            print(f"feature_list.json 不存在: {project_name}")
+            return []
         
-        # 按优先级排序，找到第一个未完成的
-        priority_order = {"P0": 0, "P1": 1, "P2": 2, "high": 0, "medium": 1, "low": 2}
+        snapshot = self._load_features(feature_file)
+        pending_sorted = snapshot.pending_sorted
         
-        def is_pending(f):
-            # 兼容两种状态字段：status 和 passes
-            status = f.get("status", "")
-            passes = f.get("passes")
-            # status 为 pending/in_progress 或 passes 为 False/None 都算未完成
-            if status in ["completed", "done"]:
-                return False
-            if passes is True:
-                return False
-            return True
+        if not pending_sorted:
+            return []
         
-        pending = [f for f in features if is_pending(f)]
+        def ready(feature: Dict) -> bool:
+            # 依赖全部完成；已完成与未完成的任务互斥，因此不会依赖批次内的其他任务
+            return all(dep in snapshot.passing_ids for dep in feature.get("dependencies", []))
         
-        if not pending:
-            return None
+        head = pending_sorted[0]
+        batch = [head]
+        if batch_size <= 1 or not ready(head):
+            return batch
+        for feature in pending_sorted[1:]:
+            if len(batch) >= batch_size:
+                break
+            if ready(feature):
+                batch.append(feature)
+        return batch
+    
+    def generate_prompt(self, tasks: Union[Dict, List[Dict]], project_name: str = "ninesun-blog") -> str:
+        """生成自动执行的 prompt，传入多个任务时生成按顺序批量执行的 prompt"""
+        if isinstance(tasks, dict):
+            tasks = [tasks]
+        
+        if len(tasks) == 1:
+            task_section = self._SINGLE_TASK_TEMPLATE.format_map(self._task_fields(tasks[0]))
+            scope_hint = "只处理这一个任务"
+            passes_hint = "完成后必须标记 passes: true"
+        else:
+            blocks = [
+                self._BATCH_TASK_TEMPLATE.format_map(self._task_fields(task, index=i))
+                for i, task in enumerate(tasks, 1)
+            ]
+            task_section = "## 任务列表\n" + "\n\n".join(blocks)
+            scope_hint = "按顺序处理这些任务，不要处理列表之外的任务"
+            passes_hint = "每完成一个任务，立即将该任务标记为 passes: true"
         
-        # 排序并返回第一个
-        pending.sort(key=lambda x: priority_order.get(x.get("priority", "medium"), 1))
-        return pending[0]
+        return self._PROMPT_TEMPLATE.format_map({
+            "project_name": project_name,
+            "task_section": task_section,
+            "scope_hint": scope_hint,
+            "passes_hint": passes_hint,
+        })
     
-    def generate_prompt(self, task: Dict, project_name: str = "ninesun-blog") -> str:
-        """生成自动执行的 prompt"""
-        prompt = f"""继续开发 **{project_name}** 项目的任务。
-
-⚠️ 重要：这是 {project_name} 项目，请只操作 {project_name}/ 目录下的文件！
-
-## 当前任务
-- ID: {task.get('id', 'Unknown')}
-- 描述: {task.get('description', 'Unknown')}
-- 优先级: {task.get('priority', 'medium')}
-- 类型: {task.get('category', 'functional')}
-
-## 执行步骤
-{self._format_steps(task.get('steps', []))}
-
-## 执行要求
-1. 读取 {project_name}/.agent-harness/feature_list.json 确认任务状态
-2. 按照任务描述完成开发
-3. 完成后运行测试验证 (如适用)
-4. 更新 {project_name}/.agent-harness/feature_list.json 中的 passes 状态为 true
-5. 更新 {project_name}/.agent-harness/claude-progress.txt 记录进度
-
-## 重要提醒
-- 只处理这一个任务
-- 只操作 {project_name}/ 目录
-- 完成后必须标记 passes: true
-- 如果遇到阻塞问题，记录到 progress 文件中并停止
-"""
-        return prompt
+    def _task_fields(self, task: Dict, index: int = 1) -> Dict[str, Any]:
+        """提取任务模板的占位符取值"""
+        return {
+            "index": index,
+            "id": task.get('id', 'Unknown'),
+            "description": task.get('description', 'Unknown'),
+            "priority": task.get('priority', 'medium'),
+            "category": task.get('category', 'functional'),
+            "steps": self._format_steps(task.get('steps', [])),
+        }
     
     def _format_steps(self, steps: List[str]) -> str:
         """格式化步骤列表"""
         if not steps:
             return "无特定步骤，按需执行"
-        return "\n".join(f"{i+1}. {s}" for i, s in enumerate(steps))
+        return "\n".join([f"{i}. {s}" for i, s in zip(range(1, len(steps) + 1), steps)])
     
-    def run_iflow(self, prompt: str, timeout: int = 600, max_turns: int = 50, 
-                  project_cwd: Optional[str] = None) -> Dict:
+    async def run_iflow(self, prompt: str, timeout: int = 600, max_turns: int = 50, 
+                  project_cwd: Optional[str] = None, parse_output: bool = False) -> Dict:
         """
         调用 iFlow CLI 执行任务
         
@@ -214,6 +496,7 @@ class iFlowRunner:
             timeout: 超时时间 (秒)
             max_turns: 最大轮次
             project_cwd: 目标项目的工作目录（iFlow 会在此目录运行）
+            parse_output: 是否解析 iflow 输出文件并放入 output_data
             
         Returns:
             执行结果
@@ -227,7 +510,10 @@ class iFlowRunner:
         # 确定工作目录：优先使用目标项目目录，否则使用 runner 的项目根目录
         work_dir = Path(project_cwd).resolve() if project_cwd else self.project_root
         
-        output_file = self.project_root / f"iflow_output_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        # 输出文件统一放在 .agent-harness/iflow_runs/ 下，不再散落在项目根目录
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        # 纳秒时间戳按时间排序且无需格式化；pid 区分多个进程，序号区分同一进程内的并行执行
+        output_file = self._output_dir / f"run_{time.time_ns()}_{os.getpid()}_{next(self._run_seq)}.json"
         
         # 使用找到的 iflow 完整路径
         cmd = [
@@ -241,47 +527,61 @@ class iFlowRunner:
         print(f"\n执行命令: {self.iflow_path} -p ... --yolo --max-turns={max_turns}")
         print(f"工作目录: {work_dir}")
         
-        # 设置环境变量，确保能找到 node 和 npm
-        env = os.environ.copy()
-        node_paths = [
-            r'C:\nvm4w\nodejs',
-            os.path.expandvars(r'%APPDATA%\npm'),
-        ]
-        for path in node_paths:
-            if os.path.isdir(path) and path not in env.get('PATH', ''):
-                env['PATH'] = path + os.pathsep + env.get('PATH', '')
-        
+        proc = None
         try:
             start_time = time.time()
             
-            result = subprocess.run(
-                cmd,
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
                 cwd=str(work_dir),  # 在目标项目目录运行 iFlow
-                capture_output=True,
-                text=True,
-                timeout=timeout + 60,  # 额外给一些缓冲时间
-                env=env
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=self._env
             )
+            # 按块读取输出，只保留末尾部分，内存占用与运行时长无关
+            # （UTF-8 中文约 3 字节/字符，按返回字符数的 4 倍保留字节）
+            stdout_tail = _OutputTail(keep_bytes=8192)
+            stderr_tail = _OutputTail(keep_bytes=4096)
+            async def drain() -> None:
+                await asyncio.gather(
+                    _read_tail(proc.stdout, stdout_tail, proc),
+                    _read_tail(proc.stderr, stderr_tail, proc),
+                    proc.wait(),
+                )
+            
+            # gather 包在协程里交给 wait_for：外部取消时 wait_for 取消的是 Task，
+            # 不会留下未取回异常的 _GatheringFuture
+            await asyncio.wait_for(drain(), timeout=timeout + 60)  # 额外给一些缓冲时间
+            stdout = stdout_tail.text(2000)
+            stderr = stderr_tail.text(1000)
             
             elapsed = time.time() - start_time
             
-            # 读取输出文件
+            # 读取输出文件：完整记录可能很大，只在需要时解析，超过上限只记录大小
             output_data = None
-            if output_file.exists():
-                with open(output_file, 'r', encoding='utf-8') as f:
-                    output_data = json.load(f)
+            output_exists = output_file.exists()
+            if output_exists and parse_output:
+                size = output_file.stat().st_size
+                if size > _MAX_OUTPUT_PARSE_BYTES:
+                    output_data = {"truncated": True, "size": size}
+                else:
+                    output_data = _json_loads(output_file.read_bytes())
             
-            return {
-                "success": result.returncode == 0,
-                "returncode": result.returncode,
+            result = {
+                "success": proc.returncode == 0,
+                "returncode": proc.returncode,
                 "elapsed_seconds": round(elapsed, 1),
-                "stdout": result.stdout[-2000:] if len(result.stdout) > 2000 else result.stdout,
-                "stderr": result.stderr[-1000:] if len(result.stderr) > 1000 else result.stderr,
-                "output_file": str(output_file) if output_file.exists() else None,
+                "stdout": stdout,
+                "stderr": stderr,
+                "output_file": str(output_file) if output_exists else None,
                 "output_data": output_data
             }
+            if max(stdout_tail.total, stderr_tail.total) > _MAX_STREAM_BYTES:
+                result["success"] = False
+                result["error"] = f"输出超过 {_MAX_STREAM_BYTES // (1024 * 1024)} MB，已终止 iflow"
+            return result
             
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             return {
                 "success": False,
                 "error": f"执行超时 (>{timeout}秒)"
@@ -296,89 +596,105 @@ class iFlowRunner:
                 "success": False,
                 "error": str(e)
             }
+        finally:
+            # 超时或被取消时结束子进程，避免遗留孤儿进程
+            if proc is not None and proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            # 每次执行后清理一次旧输出，避免目录无限增长
+            self._rotate_outputs()
+    
+    def _rotate_outputs(self) -> None:
+        """只保留最近 keep_outputs 个 iflow 输出文件"""
+        if self.keep_outputs <= 0:
+            return
+        try:
+            entries = [e for e in os.scandir(self._output_dir)
+                       if e.name.startswith('run_') and e.name.endswith('.json')]
+        except OSError:
+            return
+        if len(entries) <= self.keep_outputs:
+            return
+        
+        def mtime(entry: os.DirEntry) -> int:
+            try:
+                return entry.stat().st_mtime_ns
+            except OSError:
+                return 0
+        
+        entries.sort(key=mtime, reverse=True)
+        for old in entries[self.keep_outputs:]:
+            try:
+                os.unlink(old.path)
+            except OSError:
+                pass
     
     def scan_projects(self) -> List[str]:
         """扫描所有可用项目"""
-        projects = []
+        # dict 保序去重，同一项目经不同路径找到时只记录一次
+        projects: Dict[str, None] = {}
         
         # 扫描的目录列表：当前目录、父目录、用户指定目录
         scan_dirs = [
-            self.project_root,  # 当前目录
-            self.project_root.parent,  # 父目录 (常见场景：ai-harness 作为子目录)
+            self._project_root_str,  # 当前目录
+            self._project_parent_str,  # 父目录 (常见场景：ai-harness 作为子目录)
         ]
         
-        scanned = set()
+        seen_dirs = set()
         for scan_dir in scan_dirs:
-            if not scan_dir.exists() or str(scan_dir) in scanned:
+            # 以真实路径判重，位于文件系统根目录时当前目录与父目录相同，只扫描一次
+            key = os.path.realpath(scan_dir)
+            if key in seen_dirs:
                 continue
-            scanned.add(str(scan_dir))
+            seen_dirs.add(key)
             
             try:
-                for item in scan_dir.iterdir():
-                    if item.is_dir() and not item.name.startswith('.') and item.name not in ['node_modules', '__pycache__', '.git']:
-                        harness_dir = item / ".agent-harness"
-                        feature_file = harness_dir / "feature_list.json"
-                        if feature_file.exists():
+                # os.scandir 直接复用目录项的类型信息，避免每个子目录多次 stat
+                with os.scandir(key) as it:
+                    for entry in it:
+                        name = entry.name
+                        if name.startswith('.') or name in _SKIP_DIRS:
+                            continue
+                        # is_dir() 仅对符号链接才需要额外 stat，保留链接到项目目录的用法
+                        if not entry.is_dir():
+                            continue
+                        feature_file = os.path.join(entry.path, ".agent-harness", "feature_list.json")
+                        if os.path.isfile(feature_file):
                             # 返回绝对路径
-                            projects.append(str(item.resolve()))
-            except Exception as e:
+                            projects[os.path.realpath(entry.path)] = None
+            except OSError:
+                # 目录不存在或无权限读取
                 pass
         
-        return sorted(set(projects))
+        # 调用方按序号选择项目、自动选中第一个，因此仍按路径排序保证结果稳定
+        return sorted(projects)
     
     def get_project_status(self, project_name: str) -> Dict:
         """获取项目状态"""
-        # 支持相对路径和绝对路径
-        if Path(project_name).is_absolute():
-            feature_file = Path(project_name) / ".agent-harness" / "feature_list.json"
-        else:
-            feature_file = self.project_root / project_name / ".agent-harness" / "feature_list.json"
-        
-        if not feature_file.exists():
-            # 尝试父目录
-            feature_file = self.project_root.parent / project_name / ".agent-harness" / "feature_list.json"
+        feature_file = self._feature_file(project_name)
         
-        if not feature_file.exists():
+        if not feature_file:
             return {"error": f"项目不存在: {project_name}"}
         
         try:
-            with open(feature_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            signature = _file_signature(feature_file)
+            cached = self._status_cache.get(project_name)
+            if cached and cached[0] == signature:
+                return cached[1]
             
-            features = data.get("features", [])
-            
-            def is_completed(f):
-                status = f.get("status", "")
-                passes = f.get("passes")
-                return status in ["completed", "done"] or passes is True
-            
-            def is_pending(f):
-                status = f.get("status", "")
-                passes = f.get("passes")
-                if status in ["completed", "done"]:
-                    return False
-                if passes is True:
-                    return False
-                return True
-            
-            completed = sum(1 for f in features if is_completed(f))
-            total = len(features)
+            snapshot = self._load_features(feature_file)
+            total, completed = snapshot.total, snapshot.completed
             
             # 获取下一个任务
             next_task = None
-            for feature in features:
-                if is_pending(feature):
-                    # 检查依赖是否满足
-                    deps = feature.get("dependencies", [])
-                    deps_satisfied = all(
-                        any(f.get("id") == dep and is_completed(f) for f in features)
-                        for dep in deps
-                    )
-                    if deps_satisfied:
-                        next_task = feature
-                        break
+            for feature in snapshot.pending:
+                # 检查依赖是否满足（已完成任务 ID 为集合，只需集合查找）
+                deps = feature.get("dependencies", [])
+                if all(dep in snapshot.passing_ids for dep in deps):
+                    next_task = feature
+                    break
             
-            return {
+            status = {
                 "project": project_name,
                 "total_tasks": total,
                 "completed": completed,
@@ -390,11 +706,30 @@ class iFlowRunner:
                     "priority": next_task.get("priority")
                 } if next_task else None
             }
+            self._status_cache[project_name] = (signature, status)
+            return status
         except Exception as e:
             return {"error": str(e)}
     
-    def run_single(self, project_name: str = "ninesun-blog", timeout: int = 600, max_turns: int = 50) -> Dict:
+    def get_project_statuses(self, projects: List[str]) -> List[Dict]:
+        """并发获取多个项目的状态，返回顺序与 projects 一致"""
+        if len(projects) <= 1:
+            return [self.get_project_status(proj) for proj in projects]
+        # 冷启动时各项目的文件读取互不依赖，用线程池重叠 I/O
+        with ThreadPoolExecutor(max_workers=min(8, len(projects))) as executor:
+            return list(executor.map(self.get_project_status, projects))
+    
+    async def run_single(self, project_name: str = "ninesun-blog", timeout: int = 600, max_turns: int = 50) -> Dict:
         """执行单次任务"""
+        return await self.run_batch(project_name, timeout, max_turns, batch_size=1, parse_output=True)
+    
+    async def run_batch(self, project_name: str = "ninesun-blog", timeout: int = 600, max_turns: int = 50,
+                        batch_size: int = 1, parse_output: bool = False) -> Dict:
+        """
+        在一次 iflow 调用中执行一批互不依赖的任务
+        
+        parse_output 为 True 时在结果中附带解析后的 iflow 输出，持续模式不需要。
+        """
         # 解析项目路径
         if Path(project_name).is_absolute():
             project_path = Path(project_name)
@@ -407,42 +742,68 @@ class iFlowRunner:
         
         project_path = project_path.resolve()
         
-        # 获取下一个任务
-        task = self.get_next_task(project_name)
+        # 获取下一批任务
+        tasks = self.get_next_task_batch(project_name, batch_size)
         
-        if not task:
+        if not tasks:
             return {
                 "status": "completed",
                 "message": "🎉 所有任务已完成！"
             }
         
         print(f"\n{'='*60}")
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 开始执行任务")
+        print(f"[{_now_str()}] 开始执行任务" +
+              (f" (共 {len(tasks)} 个)" if len(tasks) > 1 else ""))
         print(f"项目路径: {project_path}")
-        print(f"ID: {task.get('id')}")
-        print(f"描述: {task.get('description')}")
-        print(f"优先级: {task.get('priority')}")
+        for task in tasks:
+            print(f"ID: {task.get('id')}")
+            print(f"描述: {task.get('description')}")
+            print(f"优先级: {task.get('priority')}")
         print(f"{'='*60}")
         
         # 生成 prompt
-        prompt = self.generate_prompt(task, Path(project_path).name)
+        prompt = self.generate_prompt(tasks, Path(project_path).name)
+        
+        # 记录执行前 feature_list.json 的版本；读取失败时记为 None，执行后按已变化处理
+        feature_file = self._feature_file(project_name)
+        pre_signature: Optional[Tuple[int, int]] = None
+        if feature_file:
+            try:
+                pre_signature = _file_signature(feature_file)
+            except OSError:
+                pass
         
         # 调用 iFlow，传入项目目录作为工作目录
-        result = self.run_iflow(prompt, timeout, max_turns, project_cwd=str(project_path))
+        result = await self.run_iflow(prompt, timeout, max_turns, project_cwd=str(project_path),
+                                      parse_output=parse_output)
         
-        # 检查任务是否完成
-        updated_task = self.get_next_task(project_name)
+        # 检查任务是否完成；feature_list.json 未被改写时任务状态不会变化，无需重新读取
+        try:
+            changed = pre_signature is None or _file_signature(feature_file) != pre_signature
+        except OSError:
+            changed = True
+        if changed:
+            feature_file = self._feature_file(project_name)
+            done_ids = self._load_features(feature_file).passing_ids if feature_file else frozenset()
+            completed_tasks = [t.get("id") for t in tasks if t.get("id") in done_ids]
+            updated_task = self.get_next_task(project_name)
+        else:
+            completed_tasks = []
+            updated_task = tasks[0]
         
         return {
             "status": "success" if result["success"] else "failed",
-            "task": task,
+            "task": tasks[0],
+            "tasks": tasks,
             "execution": result,
             "next_task": updated_task,
-            "task_completed": updated_task is None or updated_task.get("id") != task.get("id")
+            "completed_tasks": completed_tasks,
+            "task_completed": bool(completed_tasks)
         }
     
-    def run_continuous(self, project_name: str = "ninesun-blog", interval: int = 60, 
-                       max_iterations: int = 100, timeout: int = 600, max_turns: int = 50) -> None:
+    async def run_continuous(self, project_name: str = "ninesun-blog", interval: int = 60, 
+                       max_iterations: int = 100, timeout: int = 600, max_turns: int = 50,
+                       batch_size: int = 1) -> None:
         """持续运行模式"""
         print(f"\n{'='*60}")
         print(f"iFlow Runner 持续运行模式")
@@ -451,15 +812,18 @@ class iFlowRunner:
         print(f"单次超时: {timeout} 秒")
         print(f"最大轮次: {max_turns}")
         print(f"最大迭代: {max_iterations} 次")
+        print(f"批量任务: {batch_size} 个/次")
         print(f"{'='*60}\n")
         
         iteration = 0
+        # 自适应等待：成功后立即继续并缩短等待，连续失败时指数退避，最长 interval * 4
+        backoff = interval
         
         while iteration < max_iterations:
             iteration += 1
             
             try:
-                result = self.run_single(project_name, timeout, max_turns)
+                result = await self.run_batch(project_name, timeout, max_turns, batch_size)
                 
                 print(f"\n--- 执行结果 ---")
                 print(f"状态: {result.get('status')}")
@@ -471,58 +835,100 @@ class iFlowRunner:
                     break
                 
                 if result.get("task_completed"):
-                    print(f"\n✅ 任务 {result['task'].get('id')} 已完成，继续下一个...")
-                    time.sleep(5)  # 短暂等待后继续
+                    print(f"\n✅ 任务 {', '.join(str(i) for i in result['completed_tasks'])} 已完成，继续下一个...")
+                    backoff = max(1, backoff // 2)
                     continue
                 
-                print(f"\n[{datetime.now().strftime('%H:%M:%S')}] 等待 {interval} 秒后继续...")
-                time.sleep(interval)
+                print(f"\n[{_now_str('%H:%M:%S')}] 等待 {backoff} 秒后继续...")
+                await asyncio.sleep(backoff)
+                backoff = min(interval * 4, backoff * 2)
                 
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, asyncio.CancelledError):
                 print("\n\n⏹️ 收到停止信号，退出...")
                 break
             except Exception as e:
                 print(f"\n❌ 错误: {e}")
-                print(f"等待 {interval} 秒后重试...")
-                time.sleep(interval)
+                print(f"等待 {backoff} 秒后重试...")
+                await asyncio.sleep(backoff)
+                backoff = min(interval * 4, backoff * 2)
         
         print(f"\n执行完毕。共完成 {iteration} 次迭代。")
     
+    async def run_continuous_all(self, projects: List[str], concurrency: int = 4, **kwargs) -> None:
+        """
+        并行对多个项目运行持续模式
+        
+        Args:
+            projects: 项目路径列表
+            concurrency: 同时运行的项目数上限
+            **kwargs: 传给 run_continuous() 的参数
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def run_one(project: str) -> None:
+            async with semaphore:
+                await self.run_continuous(project, **kwargs)
+        
+        try:
+            await asyncio.gather(*(run_one(project) for project in projects))
+        except asyncio.CancelledError:
+            # 各项目的持续模式已自行处理停止信号；外层 gather 仍会抛出取消，这里正常返回
+            print("\n⏹️ 收到停止信号，已停止全部项目")
+    
     def status(self, project_name: str = "ninesun-blog") -> Dict:
         """获取当前状态"""
-        task = self.get_next_task(project_name)
-        
-        feature_file = self.project_root / project_name / ".agent-harness" / "feature_list.json"
+        feature_file = self._feature_file(project_name)
         
-        if not feature_file.exists():
+        if not feature_file:
             return {
                 "project": project_name,
                 "error": f"feature_list.json 不存在"
             }
         
-        with open(feature_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        features = data.get("features", [])
-        
-        def is_completed(f):
-            status = f.get("status", "")
-            passes = f.get("passes")
-            return status in ["completed", "done"] or passes is True
-        
-        completed = sum(1 for f in features if is_completed(f))
-        total = len(features)
+        snapshot = self._load_features(feature_file)
+        total, completed = snapshot.total, snapshot.completed
         
         return {
             "project": project_name,
             "total_tasks": total,
             "completed": completed,
             "pending": total - completed,
-            "next_task": task,
+            "next_task": snapshot.next_task,
             "progress": f"{completed}/{total} ({completed*100//total if total > 0 else 0}%)"
         }
 
 
+def _run_async(coro) -> Any:
+    """
+    运行协程并返回结果；Ctrl+C 中断时返回 None
+    
+    Python 3.8–3.10 中 Ctrl+C 在事件循环里抛出 KeyboardInterrupt，协程内部收到
+    CancelledError 处理完后 asyncio.run 仍会再次抛出，这里统一吞掉，与同步版本行为一致。
+    """
+    try:
+        return asyncio.run(coro)
+    except KeyboardInterrupt:
+        return None
+
+
+def print_json(data: Any) -> None:
+    """以缩进格式输出 JSON 结果，安装了 orjson 时使用 orjson 序列化"""
+    if not orjson:
+        print(json.dumps(data, indent=2, ensure_ascii=False, default=str))
+        return
+    
+    payload = orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    encoding = (getattr(sys.stdout, 'encoding', None) or '').lower().replace('-', '').replace('_', '')
+    if encoding == 'utf8' and hasattr(sys.stdout, 'buffer'):
+        # 输出编码就是 UTF-8 时直接写入字节，先刷新文本层缓冲以保持输出顺序
+        sys.stdout.flush()
+        sys.stdout.buffer.write(payload + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        # 其他编码（如重定向时的 cp936）经文本层输出，避免同一日志混用两种编码
+        print(payload.decode('utf-8'))
+
+
 def main():
     # 先解析 --project-root 以便加载正确的配置文件
     parser = argparse.ArgumentParser(description='iFlow Runner - 自动化运行 iFlow CLI')
@@ -540,6 +946,9 @@ def main():
     default_timeout = scheduler_config.get('default_timeout', 600)
     default_max_turns = scheduler_config.get('default_max_turns', 50)
     default_max_iterations = scheduler_config.get('max_iterations', 100)
+    default_batch_size = scheduler_config.get('batch_size', 1)
+    default_concurrency = scheduler_config.get('concurrency', 4)
+    default_keep_outputs = scheduler_config.get('keep_outputs', 20)
     
     # 添加完整的参数解析
     parser.add_argument('--project', default=None, help='项目名称或路径')
@@ -553,18 +962,23 @@ def main():
                        help=f'单次执行最大轮次 (默认: {default_max_turns})')
     parser.add_argument('--max-iterations', type=int, default=default_max_iterations, 
                        help=f'持续模式最大迭代次数 (默认: {default_max_iterations})')
+    parser.add_argument('--batch-size', type=int, default=default_batch_size, 
+                       help=f'持续模式每次 iflow 调用处理的任务数 (默认: {default_batch_size})')
+    parser.add_argument('--concurrency', type=int, default=default_concurrency, 
+                       help=f'未指定项目时持续模式同时运行的项目数 (默认: {default_concurrency})')
+    parser.add_argument('--keep-outputs', type=int, default=default_keep_outputs, 
+                       help=f'保留最近的 iflow 输出文件数，0 表示不清理 (默认: {default_keep_outputs})')
     
     args = parser.parse_args()
     
-    runner = iFlowRunner(args.project_root)
+    runner = iFlowRunner(args.project_root, args.keep_outputs)
     
     # 扫描可用项目
     projects = runner.scan_projects()
     
     if args.action == 'scan' or args.action == 'status':
         print(f"📋 发现 {len(projects)} 个项目:\n")
-        for proj in projects:
-            status = runner.get_project_status(proj)
+        for proj, status in zip(projects, runner.get_project_statuses(projects)):
             print(f"  • {Path(proj).name}")
             print(f"    进度: {status.get('progress', 'N/A')}")
             if status.get('next_task'):
@@ -574,6 +988,14 @@ def main():
         if args.action == 'scan':
             return
     
+    # 持续模式未指定项目时，并行运行所有项目
+    if not args.project and args.action == 'continuous' and len(projects) > 1:
+        print(f"🎯 未指定项目，并行运行全部 {len(projects)} 个项目 (并发数: {args.concurrency})\n")
+        _run_async(runner.run_continuous_all(
+            projects, args.concurrency, interval=args.interval, max_iterations=args.max_iterations,
+            timeout=args.timeout, max_turns=args.max_turns, batch_size=args.batch_size))
+        return
+    
     # 如果没有指定项目，使用第一个可用项目
     project = args.project
     if not project:
@@ -586,13 +1008,16 @@ def main():
     
     if args.action == 'status':
         result = runner.get_project_status(project)
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        print_json(result)
     elif args.action == 'run':
-        result = runner.run_single(project, args.timeout, args.max_turns)
-        print(json.dumps(result, indent=2, ensure_ascii=False, default=str))
+        result = _run_async(runner.run_single(project, args.timeout, args.max_turns))
+        if result is None:
+            print("\n⏹️ 收到停止信号，已中止执行")
+        else:
+            print_json(result)
     elif args.action == 'continuous':
-        runner.run_continuous(project, args.interval, args.max_iterations, 
-                             args.timeout, args.max_turns)
+        _run_async(runner.run_continuous(project, args.interval, args.max_iterations, 
+                                         args.timeout, args.max_turns, args.batch_size))
 
 
 def run_interactive():
@@ -611,6 +1036,7 @@ def run_interactive():
     default_interval = scheduler_config.get('interval', 60)
     default_timeout = scheduler_config.get('default_timeout', 600)
     default_max_turns = scheduler_config.get('default_max_turns', 50)
+    default_batch_size = scheduler_config.get('batch_size', 1)
     
     # 检查依赖
     iflow_path = find_iflow_path()
@@ -622,7 +1048,7 @@ def run_interactive():
         print()
     
     # 扫描可用项目
-    runner = iFlowRunner(os.getcwd())
+    runner = iFlowRunner(os.getcwd(), scheduler_config.get('keep_outputs', 20))
     projects = runner.scan_projects()
     
     if not projects:
@@ -634,8 +1060,7 @@ def run_interactive():
         return
     
     print(f"\n[*] Found {len(projects)} projects:")
-    for i, proj in enumerate(projects, 1):
-        status = runner.get_project_status(proj)
+    for i, (proj, status) in enumerate(zip(projects, runner.get_project_statuses(projects)), 1):
         # 兼容 total_tasks 和 total 两种字段名
         total = status.get('total_tasks') or status.get('total', 0)
         completed = status.get('completed', 0)
@@ -669,7 +1094,7 @@ def run_interactive():
                 print(f"[*] Project: {proj}")
                 print("="*60)
                 status = runner.get_project_status(proj)
-                print(json.dumps(status, ensure_ascii=False, indent=2))
+                print_json(status)
                 
         elif choice == '2':
             # 单次执行
@@ -677,8 +1102,12 @@ def run_interactive():
             if proj:
                 print(f"\n[>] Running: {proj}")
                 print("="*60)
-                result = runner.run_single(proj, timeout=default_timeout, max_turns=default_max_turns)
-                print("\nResult:", json.dumps(result, ensure_ascii=False, indent=2))
+                result = _run_async(runner.run_single(proj, timeout=default_timeout, max_turns=default_max_turns))
+                if result is None:
+                    print("\n⏹️ 收到停止信号，已中止执行")
+                else:
+                    print("\nResult:", end=" ")
+                    print_json(result)
                 projects = runner.scan_projects()  # 刷新项目列表
                 
         elif choice == '3':
@@ -689,8 +1118,9 @@ def run_interactive():
                 print("="*60)
                 print("Press Ctrl+C to stop")
                 print()
-                runner.run_continuous(proj, interval=default_interval, 
-                                     timeout=default_timeout, max_turns=default_max_turns)
+                _run_async(runner.run_continuous(proj, interval=default_interval, 
+                                                 timeout=default_timeout, max_turns=default_max_turns,
+                                                 batch_size=default_batch_size))
                 projects = runner.scan_projects()  # 刷新项目列表
                 
         elif choice == '4':
@@ -703,13 +1133,11 @@ def run_interactive():
         else:
             print("[!] Invalid choice")
         
-        # 刷新项目列表显示
+        # 刷新项目列表显示（项目列表只在执行或新建项目后重新扫描，状态走缓存）
         print("\n" + "-" * 60)
-        projects = runner.scan_projects()
         if projects:
             print(f"[*] Projects ({len(projects)}):")
-            for i, proj in enumerate(projects, 1):
-                status = runner.get_project_status(proj)
+            for i, (proj, status) in enumerate(zip(projects, runner.get_project_statuses(projects)), 1):
                 total = status.get('total_tasks') or status.get('total', 0)
                 completed = status.get('completed', 0)
                 progress = f"{completed}/{total}"
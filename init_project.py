@@ -13,12 +13,16 @@ AI Harness 项目初始化脚本
 """
 
 import os
+import re
 import sys
 import json
 import shutil
+import itertools
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Tuple, Union, Iterable
 
 
 # ANSI 颜色代码
@@ -32,6 +36,36 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# 脚本所在目录，导入时解析一次
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# 扫描候选目录时跳过的目录名（以 . 开头的目录如 .git 另行统一跳过）
+_EXCLUDED_DIRS = frozenset({'node_modules', '__pycache__', 'dist', 'build', 'target'})
+
+# 提取项目描述时先读取 README.md 开头的字节数
+_README_HEAD_BYTES = 4096
+# 开头没有找到描述时，逐行继续查找的最大行数
+_README_MAX_LINES = 500
+
+# Gradle 构建脚本 (Groovy / Kotlin DSL)
+_GRADLE_FILES = frozenset({'build.gradle', 'build.gradle.kts'})
+
+# Node.js 依赖名 -> 框架名，按检测优先级排列
+_NODE_FRAMEWORKS = (
+    ("react", "React"),
+    ("vue", "Vue"),
+    ("next", "Next.js"),
+    ("express", "Express"),
+    ("@nestjs/core", "NestJS"),
+)
+
+# pom.xml 模块解析用的正则，导入时编译一次
+_MODULES_BLOCK_RE = re.compile(r'<modules>(.*?)</modules>', re.DOTALL)
+_MODULE_RE = re.compile(r'<module>(.*?)</module>')
+# 不区分大小写匹配 Spring Boot 依赖，避免复制整个 pom 内容做 lower()
+_SPRING_BOOT_RE = re.compile(r'spring-boot|org\.springframework\.boot', re.IGNORECASE)
+
+
 def print_header():
     """打印标题"""
     print("\n")
@@ -43,7 +77,7 @@ def print_header():
     print()
 
 
-def detect_project_type(project_dir: Path) -> Dict:
+def detect_project_type(project_dir: Union[str, Path]) -> Dict:
     """
     检测项目类型和技术栈
     
@@ -58,102 +92,95 @@ def detect_project_type(project_dir: Path) -> Dict:
         "modules": [],
     }
     
+    # 函数内部只用字符串路径，避免逐个创建 Path 对象
+    root = os.fspath(project_dir)
+    
+    # 一次列目录取得全部文件名，之后的判断都是内存中的集合查找
+    try:
+        with os.scandir(root) as it:
+            names = {entry.name for entry in it if entry.is_file()}
+    except OSError:
+        return info
+    
     # Java/Maven 项目
-    pom_file = project_dir / "pom.xml"
-    if pom_file.exists():
+    if "pom.xml" in names:
         info["type"] = "java-maven"
         info["language"] = "Java"
         info["build_tool"] = "Maven"
         
-        # 尝试解析 pom.xml 获取更多信息
-        try:
-            content = pom_file.read_text(encoding='utf-8')
+        # 尝试解析 pom.xml 获取更多信息，读取失败时保留基础信息
+        with suppress(OSError, UnicodeDecodeError):
+            with open(os.path.join(root, "pom.xml"), encoding='utf-8') as f:
+                content = f.read()
             
             # 检测 Spring Boot
-            if 'spring-boot' in content.lower() or 'org.springframework.boot' in content:
+            if _SPRING_BOOT_RE.search(content):
                 info["framework"] = "Spring Boot"
             
             # 检测多模块项目
             if '<modules>' in content:
                 info["modules"] = extract_maven_modules(content)
-                
-        except:
-            pass
         
         return info
     
     # Java/Gradle 项目
-    gradle_file = project_dir / "build.gradle" or project_dir / "build.gradle.kts"
-    if gradle_file.exists():
+    if names & _GRADLE_FILES:
         info["type"] = "java-gradle"
         info["language"] = "Java"
         info["build_tool"] = "Gradle"
         return info
     
     # Node.js 项目
-    package_json = project_dir / "package.json"
-    if package_json.exists():
+    if "package.json" in names:
         info["type"] = "nodejs"
         info["language"] = "JavaScript/TypeScript"
         info["build_tool"] = "npm/yarn/pnpm"
         
-        try:
-            data = json.loads(package_json.read_text(encoding='utf-8'))
-            deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
+        # ValueError 覆盖 JSON 格式与解码错误；结构不符预期时抛出 AttributeError / TypeError
+        with suppress(OSError, ValueError, AttributeError, TypeError):
+            with open(os.path.join(root, "package.json"), encoding='utf-8') as f:
+                data = json.load(f)
+            # 直接在两个依赖表中查找，不必合并出新字典
+            deps = data.get("dependencies") or {}
+            dev_deps = data.get("devDependencies") or {}
             
-            # 检测框架
-            if "react" in deps:
-                info["framework"] = "React"
-            elif "vue" in deps:
-                info["framework"] = "Vue"
-            elif "next" in deps:
-                info["framework"] = "Next.js"
-            elif "express" in deps:
-                info["framework"] = "Express"
-            elif "@nestjs/core" in deps:
-                info["framework"] = "NestJS"
-                
-        except:
-            pass
+            # 检测框架，按优先级取第一个命中的依赖
+            for dep, framework in _NODE_FRAMEWORKS:
+                if dep in deps or dep in dev_deps:
+                    info["framework"] = framework
+                    break
         
         return info
     
     # Python 项目
-    requirements = project_dir / "requirements.txt"
-    pyproject = project_dir / "pyproject.toml"
-    setup_py = project_dir / "setup.py"
-    
-    if requirements.exists() or pyproject.exists() or setup_py.exists():
+    if "requirements.txt" in names or "pyproject.toml" in names or "setup.py" in names:
         info["type"] = "python"
         info["language"] = "Python"
         info["build_tool"] = "pip/poetry"
         
         # 检测框架
-        try:
-            if requirements.exists():
-                content = requirements.read_text(encoding='utf-8').lower()
+        if "requirements.txt" in names:
+            with suppress(OSError, UnicodeDecodeError):
+                with open(os.path.join(root, "requirements.txt"), encoding='utf-8') as f:
+                    content = f.read().lower()
                 if "django" in content:
                     info["framework"] = "Django"
                 elif "flask" in content:
                     info["framework"] = "Flask"
                 elif "fastapi" in content:
                     info["framework"] = "FastAPI"
-        except:
-            pass
         
         return info
     
     # Go 项目
-    go_mod = project_dir / "go.mod"
-    if go_mod.exists():
+    if "go.mod" in names:
         info["type"] = "go"
         info["language"] = "Go"
         info["build_tool"] = "go mod"
         return info
     
     # Rust 项目
-    cargo_toml = project_dir / "Cargo.toml"
-    if cargo_toml.exists():
+    if "Cargo.toml" in names:
         info["type"] = "rust"
         info["language"] = "Rust"
         info["build_tool"] = "Cargo"
@@ -164,13 +191,10 @@ def detect_project_type(project_dir: Path) -> Dict:
 
 def extract_maven_modules(pom_content: str) -> List[str]:
     """从 pom.xml 提取模块列表"""
-    import re
-    modules = []
-    match = re.search(r'<modules>(.*?)</modules>', pom_content, re.DOTALL)
-    if match:
-        module_matches = re.findall(r'<module>(.*?)</module>', match.group(1))
-        modules = [m.strip() for m in module_matches]
-    return modules
+    match = _MODULES_BLOCK_RE.search(pom_content)
+    if not match:
+        return []
+    return [m.strip() for m in _MODULE_RE.findall(match.group(1))]
 
 
 def scan_candidate_dirs(script_dir: Path) -> List[Tuple[Path, str]]:
@@ -180,17 +204,49 @@ def scan_candidate_dirs(script_dir: Path) -> List[Tuple[Path, str]]:
     Returns:
         [(目录路径, 显示标签), ...]
     """
+    # (小写名称, 目录路径, 显示标签)：排序键在扫描时算好，排序时直接比较元组
     candidates = []
+    # 扫描时按真实路径去重，指向同级目录的符号链接不会重复出现
+    seen = set()
+    links = []
     
-    # 只扫描同级目录
+    # 只扫描同级目录；os.scandir 直接返回目录项类型，无需逐项 stat
     parent = script_dir.parent
-    if parent.exists():
-        for item in parent.iterdir():
-            if item.is_dir() and not item.name.startswith('.'):
-                if item.name not in ['node_modules', '__pycache__', '.git', 'dist', 'build', 'target']:
-                    candidates.append((item, item.name))
-    
-    return sorted(candidates, key=lambda x: x[0].name.lower())
+    parent_real = os.path.realpath(parent)
+    try:
+        with os.scandir(parent) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith('.') or name in _EXCLUDED_DIRS:
+                    continue
+                if not entry.is_dir():
+                    continue
+                if entry.is_symlink():
+                    links.append(entry)
+                    continue
+                seen.add(os.path.join(parent_real, name))
+                candidates.append((name.lower(), Path(entry.path), name))
+    except OSError:
+        pass
+    
+    # 符号链接最后处理，同一目录优先显示真实目录名
+    for entry in links:
+        real = os.path.realpath(entry.path)
+        if real not in seen:
+            seen.add(real)
+            candidates.append((entry.name.lower(), Path(entry.path), entry.name))
+    
+    candidates.sort()
+    return [(path, label) for _, path, label in candidates]
+
+
+def _first_description_line(lines: Iterable[str]) -> Optional[str]:
+    """返回第一行可作为描述的正文（非标题且长度超过 10），没有时返回 None"""
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith('#') and len(line) > 10:
+            return line
+    return None
 
 
 def get_project_description(project_dir: Path, project_info: Dict) -> str:
@@ -199,17 +255,22 @@ def get_project_description(project_dir: Path, project_info: Dict) -> str:
     
     # 尝试从现有文档获取描述
     readme = project_dir / "README.md"
-    if readme.exists():
-        try:
-            content = readme.read_text(encoding='utf-8')
-            # 提取第一段作为描述
-            lines = content.split('\n')
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith('#') and len(line) > 10:
-                    return f"{name} - {line[:100]}"
-        except:
-            pass
+    try:
+        with open(readme, 'rb') as f:
+            # 标题和简介几乎总在开头，先只读取前 _README_HEAD_BYTES 字节
+            head = f.read(_README_HEAD_BYTES)
+            line = _first_description_line(head.decode('utf-8', errors='replace').splitlines())
+            if line is None and len(head) == _README_HEAD_BYTES:
+                # 开头是大段徽章/HTML 等内容时，从头逐行读取，最多 _README_MAX_LINES 行
+                f.seek(0)
+                line = _first_description_line(
+                    raw.decode('utf-8', errors='replace')
+                    for raw in itertools.islice(f, _README_MAX_LINES)
+                )
+        if line is not None:
+            return f"{name} - {line[:100]}"
+    except OSError:
+        pass
     
     # 根据 tech stack 生成描述
     lang = project_info.get("language", "unknown")
@@ -221,8 +282,8 @@ def get_project_description(project_dir: Path, project_info: Dict) -> str:
         return f"{name} - {lang} 项目"
 
 
-def generate_feature_list(project_dir: Path, project_info: Dict) -> Dict:
-    """生成 feature_list.json 内容"""
+def generate_feature_list(project_dir: Path, project_info: Dict, now_iso: Optional[str] = None) -> Dict:
+    """生成 feature_list.json 内容，now_iso 为创建时间 (ISO 格式)，为空时取当前时间"""
     name = project_dir.name
     description = get_project_description(project_dir, project_info)
     
@@ -253,10 +314,13 @@ def generate_feature_list(project_dir: Path, project_info: Dict) -> Dict:
     if project_info.get("build_tool"):
         tech_stack["build"] = project_info.get("build_tool")
     
+    # 创建时间与最后更新时间取同一时刻
+    if now_iso is None:
+        now_iso = datetime.now().isoformat()
     feature_list = {
         "project_spec": description,
-        "created_at": datetime.now().isoformat(),
-        "last_updated": datetime.now().isoformat(),
+        "created_at": now_iso,
+        "last_updated": now_iso,
         "tech_stack": tech_stack,
         "modules": {
             "description": "项目模块",
@@ -393,8 +457,8 @@ def generate_agent_instructions(project_dir: Path, project_info: Dict) -> str:
     return content
 
 
-def generate_progress_log(project_dir: Path, project_info: Dict) -> str:
-    """生成 claude-progress.txt 内容"""
+def generate_progress_log(project_dir: Path, project_info: Dict, now_short: Optional[str] = None) -> str:
+    """生成 claude-progress.txt 内容，now_short 为初始化时间 (%Y-%m-%d %H:%M)，为空时取当前时间"""
     name = project_dir.name
     lang = project_info.get("language", "unknown")
     framework = project_info.get("framework", "")
@@ -402,6 +466,8 @@ def generate_progress_log(project_dir: Path, project_info: Dict) -> str:
     tech_info = lang
     if framework:
         tech_info += f" + {framework}"
+    if now_short is None:
+        now_short = datetime.now().strftime('%Y-%m-%d %H:%M')
     
     content = f'''# Claude Progress Log
 
@@ -411,7 +477,7 @@ PROJECT: {name}
 技术栈: {tech_info}
 ================================================================================
 
-[初始化] {datetime.now().strftime('%Y-%m-%d %H:%M')}
+[初始化] {now_short}
 Status: PROJECT_INITIALIZED
 Summary:
   - 创建 .agent-harness 目录结构
@@ -434,15 +500,23 @@ NEXT FEATURES:
     return content
 
 
-def init_project(project_dir: Path) -> bool:
+def init_project(project_dir: Path, project_info: Optional[Dict] = None) -> bool:
     """
     初始化项目的 .agent-harness 目录
     
+    Args:
+        project_dir: 目标项目目录
+        project_info: 已检测的项目信息，为空时重新检测
+    
     Returns:
         是否成功
     """
+    # 整个初始化过程使用同一时刻，各文件中的时间保持一致
+    now = datetime.now()
+    
     # 检测项目类型
-    project_info = detect_project_type(project_dir)
+    if project_info is None:
+        project_info = detect_project_type(project_dir)
     
     print(f"\n{Colors.BLUE}[检测项目]{Colors.RESET}")
     print(f"  目录: {project_dir}")
@@ -462,7 +536,7 @@ def init_project(project_dir: Path) -> bool:
             print("已取消")
             return False
         # 备份旧文件
-        backup_dir = project_dir / f".agent-harness.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        backup_dir = project_dir / f".agent-harness.backup.{now.strftime('%Y%m%d_%H%M%S')}"
         shutil.move(str(harness_dir), str(backup_dir))
         print(f"已备份到: {backup_dir.name}")
     
@@ -472,7 +546,7 @@ def init_project(project_dir: Path) -> bool:
     # 生成文件
     try:
         # feature_list.json
-        feature_list = generate_feature_list(project_dir, project_info)
+        feature_list = generate_feature_list(project_dir, project_info, now.isoformat())
         with open(harness_dir / "feature_list.json", 'w', encoding='utf-8') as f:
             json.dump(feature_list, f, ensure_ascii=False, indent=2)
         
@@ -482,7 +556,7 @@ def init_project(project_dir: Path) -> bool:
             f.write(instructions)
         
         # claude-progress.txt
-        progress = generate_progress_log(project_dir, project_info)
+        progress = generate_progress_log(project_dir, project_info, now.strftime('%Y-%m-%d %H:%M'))
         with open(harness_dir / "claude-progress.txt", 'w', encoding='utf-8') as f:
             f.write(progress)
         
@@ -503,8 +577,7 @@ def run_interactive():
     """交互式模式"""
     print_header()
     
-    # 获取脚本所在目录
-    script_dir = Path(__file__).parent.resolve()
+    script_dir = SCRIPT_DIR
     
     print(f"{Colors.CYAN}[扫描目录]{Colors.RESET}")
     print(f"  从 {script_dir.parent} 扫描...")
@@ -519,7 +592,7 @@ def run_interactive():
         custom_path = input("> ").strip()
         if custom_path:
             custom_dir = Path(custom_path)
-            if custom_dir.exists() and custom_dir.is_dir():
+            if custom_dir.is_dir():
                 candidates = [(custom_dir, "自定义路径")]
             else:
                 print(f"{Colors.RED}[错误]{Colors.RESET} 目录不存在")
@@ -536,39 +609,46 @@ def run_interactive():
         else:
             no_harness.append((path, label))
     
-    # 分页设置
+    # 分页设置；菜单编号 n 直接对应 all_items[n - 1]
     PAGE_SIZE = 10
     all_items = [(p, l, 'new') for p, l in no_harness] + [(p, l, 'existing') for p, l in has_harness]
     total = len(all_items)
     total_pages = (total + PAGE_SIZE - 1) // PAGE_SIZE
     current_page = 0
+    # 项目类型检测结果: 目录 -> 项目信息，翻页重绘和初始化时复用
+    detected: Dict[Path, Dict] = {}
     
     while True:
         # 清屏并显示当前页
         print("\033[2J\033[H", end="")  # Clear screen and move cursor to top
         print_header()
         
-        print(f"{Colors.BOLD}候选项目目录 ({total} 个){Colors.RESET}")
-        print("-" * 60)
+        # 整页内容先拼接，最后一次写出，减少终端写入次数
+        separator = "-" * 60 + "\n"
+        parts = [f"{Colors.BOLD}候选项目目录 ({total} 个){Colors.RESET}\n", separator]
         
         start_idx = current_page * PAGE_SIZE
         end_idx = min(start_idx + PAGE_SIZE, total)
-        display_idx = 1
+        
+        # 本页尚未检测的目录并行检测，各目录的 I/O 互不依赖
+        pending = [p for p, _, _ in all_items[start_idx:end_idx] if p not in detected]
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+                detected.update(zip(pending, executor.map(detect_project_type, pending)))
         
         for i in range(start_idx, end_idx):
             path, label, status = all_items[i]
-            info = detect_project_type(path)
+            info = detected[path]
             type_tag = f"[{info['type']}]" if info['type'] != 'unknown' else ""
             
             if status == 'new':
-                print(f"  {Colors.GREEN}{i+1}{Colors.RESET}. {path.name} {type_tag}")
-                print(f"      {Colors.GREEN}[待初始化]{Colors.RESET} {label}")
+                color, tag = Colors.GREEN, "[待初始化]"
             else:
-                print(f"  {Colors.YELLOW}{i+1}{Colors.RESET}. {path.name} {type_tag}")
-                print(f"      {Colors.YELLOW}[已初始化]{Colors.RESET} {label}")
-            print()
+                color, tag = Colors.YELLOW, "[已初始化]"
+            parts.append(f"  {color}{i+1}{Colors.RESET}. {path.name} {type_tag}\n"
+                         f"      {color}{tag}{Colors.RESET} {label}\n\n")
         
-        print("-" * 60)
+        parts.append(separator)
         
         # 分页导航提示
         nav_hints = []
@@ -579,9 +659,11 @@ def run_interactive():
         nav_hints.append(f"{Colors.CYAN}0{Colors.RESET}=自定义路径")
         nav_hints.append(f"{Colors.CYAN}Q{Colors.RESET}=退出")
         
-        print(f"  {' | '.join(nav_hints)}")
-        print(f"  页码: {current_page + 1}/{total_pages}")
-        print("-" * 60)
+        parts.append(f"  {' | '.join(nav_hints)}\n")
+        parts.append(f"  页码: {current_page + 1}/{total_pages}\n")
+        parts.append(separator)
+        sys.stdout.write(''.join(parts))
+        sys.stdout.flush()
         
         # 选择
         choice = input(f"\n请选择 [1-{total}]: ").strip().upper()
@@ -596,7 +678,7 @@ def run_interactive():
             if not custom_path:
                 continue
             target_dir = Path(custom_path)
-            if not target_dir.exists():
+            if not target_dir.is_dir():
                 print(f"{Colors.RED}[错误]{Colors.RESET} 目录不存在: {custom_path}")
                 input("按回车继续...")
                 continue
@@ -624,42 +706,12 @@ def run_interactive():
             input("按回车继续...")
             continue
     
-    if choice == 'Q' or choice == '':
-        print("\n已退出")
-        return
-    
-    if choice == '0':
-        print("\n请输入目标目录路径:")
-        custom_path = input("> ").strip()
-        if not custom_path:
-            print("已取消")
-            return
-        target_dir = Path(custom_path)
-        if not target_dir.exists():
-            print(f"{Colors.RED}[错误]{Colors.RESET} 目录不存在: {custom_path}")
-            return
-    else:
-        try:
-            num = int(choice)
-            if num < 1 or num > total:
-                print(f"{Colors.RED}[错误]{Colors.RESET} 无效选择")
-                return
-            
-            # 根据编号确定是哪个目录
-            if num <= len(no_harness):
-                target_dir, _ = no_harness[num - 1]
-            else:
-                target_dir, _ = has_harness[num - len(no_harness) - 1]
-        except ValueError:
-            print(f"{Colors.RED}[错误]{Colors.RESET} 无效输入")
-            return
-    
     # 初始化
     print(f"\n{'='*60}")
     print(f"{Colors.BOLD}初始化项目{Colors.RESET}: {target_dir.name}")
     print(f"{'='*60}")
     
-    success = init_project(target_dir)
+    success = init_project(target_dir, detected.get(target_dir))
     
     if success:
         print(f"\n{Colors.GREEN}{'='*60}")
@@ -674,10 +726,9 @@ def main():
     """主入口"""
     # Windows 控制台编码
     if sys.platform == 'win32':
-        try:
+        # 输出被替换为不支持 reconfigure 的流时忽略
+        with suppress(AttributeError):
             sys.stdout.reconfigure(encoding='utf-8')
-        except:
-            pass
     
     run_interactive()
 